@@ -38,6 +38,8 @@ public class DailyReportGenerator {
     private static final ObjectMapper objectMapper = new ObjectMapper()
             .registerModule(new JavaTimeModule())
             .disable(com.fasterxml.jackson.databind.SerializationFeature.WRITE_DATES_AS_TIMESTAMPS);
+    private static final DateTimeFormatter FILE_DATE_FORMAT = DateTimeFormatter.ofPattern("yyyy-MM-dd");
+    private static final DateTimeFormatter DISPLAY_DATE_FORMAT = DateTimeFormatter.ofPattern("MMMM dd, yyyy");
     
     private final HttpClient httpClient = HttpClient.newBuilder()
             .connectTimeout(Duration.ofSeconds(30))
@@ -708,7 +710,7 @@ private ReportData analyzeRepository(RepositoryConfig config) {
             Files.createDirectories(reportDir);
         }
         
-        String timestamp = LocalDateTime.now().format(DateTimeFormatter.ofPattern("yyyy-MM-dd"));
+        String timestamp = LocalDateTime.now().format(FILE_DATE_FORMAT);
         
         // Save JSON report
         String jsonFilename = String.format("daily-report-all-branches-%s.json", timestamp);
@@ -729,7 +731,7 @@ private ReportData analyzeRepository(RepositoryConfig config) {
 // Complete the generateHtmlReport method from where it was cut off:
 private void generateHtmlReport(List<ReportData> reports, Path htmlFile) throws IOException {
     StringBuilder html = new StringBuilder();
-    String date = LocalDate.now().format(DateTimeFormatter.ofPattern("MMMM dd, yyyy"));
+    String date = LocalDate.now().format(DISPLAY_DATE_FORMAT);
     
     html.append("<!DOCTYPE html><html><head>")
         .append("<title>Daily Code Contribution Report (All Branches) - ").append(date).append("</title>")
@@ -847,7 +849,7 @@ private void generateCsvReport(List<ReportData> reports, Path csvFile) throws IO
 public void printSummary(List<ReportData> reports) {
     System.out.println("\n" + "=".repeat(60));
     System.out.println("DAILY CODE CONTRIBUTION REPORT (ALL BRANCHES)");
-    System.out.println(LocalDate.now().format(DateTimeFormatter.ofPattern("MMMM dd, yyyy")));
+    System.out.println(LocalDate.now().format(DISPLAY_DATE_FORMAT));
     System.out.println("=".repeat(60));
     
     int totalCommits = 0;